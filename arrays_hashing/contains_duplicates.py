@@ -32,4 +32,109 @@ class Solution:
 
 '''
 The first solution as one minor upside in that it will exit early once a duplicate is detected.
-'''
\ No newline at end of file
+'''
+
+# NumPy Solution (Sort + Compare Neighbors)
+
+def hasDuplicate(self, nums: List[int]) -> bool:
+    # For tiny inputs the numpy call overhead costs more than it saves
+    if len(nums) < 32:
+        return len(set(nums)) < len(nums)
+
+    import numpy as np
+
+    arr = np.array(nums)
+    arr.sort()
+    return bool((arr[1:] == arr[:-1]).any())
+
+'''
+After sorting, any duplicates end up right next to each other, so comparing the array against itself shifted by
+one finds them. The sort and the compare both run in C, instead of doing a Python level set lookup for every element.
+
+This gives up the early exit from my solution, and sorting is O(n log n), but for big arrays skipping the Python
+loop is worth more than that. It uses np.array instead of np.asarray because np.array always copies. If the caller
+passes in a numpy array, np.asarray would hand back that same array and arr.sort() would reorder it in place.
+'''
+
+
+# Local add Solution
+
+def hasDuplicate(self, nums: List[int]) -> bool:
+    seen = set()
+    add = seen.add
+
+    for num in nums:
+        if num in seen:
+            return True
+        add(num)
+
+    return False
+
+'''
+Same as my first solution (and keeps the early exit), but seen.add is looked up once before the loop and saved
+in a local. Otherwise Python looks up the add attribute on the set again on every iteration.
+'''
+
+
+# Bitset Solution
+
+# Largest value range to use a bitset for (1 MB of bits), past that it falls back to a set
+_BITSET_MAX_RANGE = 1 << 23
+
+def hasDuplicate(self, nums: List[int]) -> bool:
+    if not nums:
+        return False
+
+    lo = min(nums)
+    hi = max(nums)
+
+    if hi - lo >= _BITSET_MAX_RANGE:
+        return len(set(nums)) < len(nums)
+
+    bits = bytearray((hi - lo) // 8 + 1)
+
+    for num in nums:
+        i = num - lo
+        byte = i >> 3
+        bit = 1 << (i & 7)
+        if bits[byte] & bit:
+            return True
+        bits[byte] |= bit
+
+    return False
+
+'''
+When the numbers are in a small range, each possible value can get one bit in a bytearray instead of an entry in a
+set. Checking and setting a bit doesn't need any hashing, and the bytearray is around 8x smaller than the set
+for the same numbers, so more of it stays in cache.
+
+min and max add two extra passes over nums to size the bitset. If the range is too big the bitset would be
+huge, so it uses a set instead.
+'''
+
+
+# NumPy bincount Solution
+
+# bincount always gets at least this many counters to work with, even for tiny inputs
+_BINCOUNT_MIN_RANGE = 1 << 16
+
+def hasDuplicate(self, nums: List[int]) -> bool:
+    if not nums:
+        return False
+
+    import numpy as np
+
+    a = np.asarray(nums)
+
+    # bincount makes one counter per value from 0 to max, so only use it when max is small compared to len(nums)
+    if a.min() >= 0 and a.max() < max(8 * len(a), _BINCOUNT_MIN_RANGE):
+        return bool(np.bincount(a).max() > 1)
+
+    return len(set(nums)) < len(nums)
+
+'''
+np.bincount counts how many times each value shows up in one pass in C, and any count above 1 is a duplicate.
+This only works for non-negative integers, and it allocates an int64 counter for every value up to the biggest
+one. So the range is capped at 8 counters per number (or _BINCOUNT_MIN_RANGE for small inputs), which keeps the
+memory in line with the size of nums. Anything else, like [0, 9_999_999], uses the set solution.
+'''
@@ -73,3 +73,200 @@ def search(self, nums: List[int], target: int) -> int:
 
     return -1
 
+# Branch-Free Solution (Uniform Binary Search)
+
+def search(self, nums: List[int], target: int) -> int:
+    if not nums:
+        return -1
+
+    base = 0
+    n = len(nums)
+
+    while n > 1:
+        half = n >> 1
+        base = base + half if nums[base + half] <= target else base
+        n -= half
+
+    return base if nums[base] == target else -1
+
+'''
+The correct solution has a three way if/elif/else in the loop and returns early when it finds the target.
+Which branch gets taken is basically a coin flip on random targets, so the CPU mispredicts about half the time.
+
+This version never exits early. The loop always runs ceil(log2(n)) times for a given len(nums), and the only
+decision per iteration is whether to move base forward by half. The equality check happens once at the end.
+'''
+
+# Numba Solution
+
+from functools import lru_cache
+
+@lru_cache(maxsize=None)
+def _search_nb():
+    from numba import njit, int64
+
+    @njit(int64(int64[::1], int64), cache=True, fastmath=True)
+    def _search(nums, target):
+        if nums.shape[0] == 0:
+            return -1
+
+        base = 0
+        n = nums.shape[0]
+
+        while n > 1:
+            half = n >> 1
+            base = base + half if nums[base + half] <= target else base
+            n -= half
+
+        return base if nums[base] == target else -1
+
+    return _search
+
+def search(self, nums: List[int], target: int) -> int:
+    import numpy as np
+
+    arr = np.ascontiguousarray(nums, dtype=np.int64)
+    return int(_search_nb()(arr, target))
+
+'''
+Same branch-free loop as above, but compiled to machine code with numba. Giving @njit the signature up front
+fixes the types to int64, so there's exactly one compiled version instead of one per type numba sees. It still
+compiles on the first search though: numba is imported inside _search_nb(), which only runs when search is first
+called, so importing this file for the plain Python solutions doesn't import numba. lru_cache makes sure the
+kernel is only built once, and cache=True saves the compiled version to disk so later runs skip compiling.
+
+If nums is already a contiguous int64 numpy array, np.ascontiguousarray hands it back without copying.
+'''
+
+# Half-Open Solution
+
+def search(self, nums: List[int], target: int) -> int:
+    if not nums:
+        return -1
+
+    lo, hi = 0, len(nums)
+
+    while hi - lo > 1:
+        mid = (lo + hi) >> 1
+        if nums[mid] <= target:
+            lo = mid
+        else:
+            hi = mid
+
+    return lo if nums[lo] == target else -1
+
+'''
+The correct solution keeps [front_index, back_index] with both ends included, needs the <= in the loop condition,
+and has the == check inside the loop as a second way out. Here the range is [lo, hi) and the loop only stops once
+one element is left, so there's a single exit and one compare per iteration. Whether target is there gets checked
+once at the end. >> 1 is the same as // 2 for these non-negative indexes.
+'''
+
+# Batch Solution (many targets against the same nums)
+
+def search_many(nums: List[int], targets: List[int]) -> List[int]:
+    import numpy as np
+
+    a = np.asarray(nums)
+    t = np.asarray(targets)
+
+    if len(a) == 0:
+        return [-1] * len(t)
+
+    # Searching the targets in sorted order means each search goes down almost the same path as the last one
+    order = t.argsort()
+    sorted_t = t[order]
+
+    idx = np.searchsorted(a, sorted_t)
+    found = (idx < len(a)) & (a[idx.clip(max=len(a) - 1)] == sorted_t)
+
+    result = np.empty(len(t), dtype=np.int64)
+    result[order] = np.where(found, idx, -1)
+    return result.tolist()
+
+'''
+np.searchsorted does the binary searches in C for every target at once. It gives the index where each target
+would be inserted, so a target was found if that index is in range and nums has the target there.
+
+Sorting the targets first is the main trick. Neighboring targets then compare the same way at nearly every step,
+so the CPU predicts the branches well, and the parts of nums they touch are still in cache. result[order] = ...
+puts the answers back in the original order of targets.
+'''
+
+# C SIMD Batch Solution
+
+import ctypes
+import os
+
+@lru_cache(maxsize=None)
+def _bsearch_simd_lib():
+    # Built from bsearch_simd.c, see the comment at the top of that file
+    lib = ctypes.CDLL(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'libbsearch_simd.so'))
+    i64_p = ctypes.POINTER(ctypes.c_int64)
+    lib.bsearch_batch.argtypes = [i64_p, ctypes.c_int64, i64_p, ctypes.c_int64, i64_p]
+    lib.bsearch_batch.restype = None
+    return lib
+
+def search_many(nums: List[int], targets: List[int]) -> List[int]:
+    import numpy as np
+
+    x = np.ascontiguousarray(nums, dtype=np.int64)
+    y = np.ascontiguousarray(targets, dtype=np.int64)
+    out = np.empty(len(y), dtype=np.int64)
+
+    i64_p = ctypes.POINTER(ctypes.c_int64)
+    _bsearch_simd_lib().bsearch_batch(
+        x.ctypes.data_as(i64_p), len(x),
+        y.ctypes.data_as(i64_p), len(y),
+        out.ctypes.data_as(i64_p),
+    )
+    return out.tolist()
+
+'''
+The same branch-free search as before, but the loop over targets is in C. When nums only has a few hundred numbers
+it all stays in cache, and the slow part is the steps of each search. Every search takes the same number of steps,
+so the C code does 4 targets at once with AVX2 intrinsics (4 int64s per register): a gather for the X loads, then a
+compare + blend for the select. GCC wouldn't vectorize the plain loop by itself (even with #pragma omp simd it
+couldn't work out the inner loop's trip count), which is why it's written out by hand. Built without AVX2 it's just
+a scalar C loop.
+'''
+
+# Generated Code Solution (specialized to len(nums))
+
+@lru_cache(maxsize=None)
+def _make_search(n):
+    if n == 0:
+        return lambda a, t: -1
+
+    # Write out the branch-free loop for this n with every step unrolled
+    src = 'def f(a, t):\n    i = 0\n'
+    cur_n = n
+    while cur_n > 1:
+        half = cur_n >> 1
+        src += f'    i = i + {half} if a[i + {half}] <= t else i\n'
+        cur_n -= half
+    src += '    return i if a[i] == t else -1\n'
+
+    ns = {}
+    exec(src, ns)
+    return ns['f']
+
+def search(self, nums: List[int], target: int) -> int:
+    return _make_search(len(nums))(nums, target)
+
+'''
+When search gets called over and over with nums of the same length, the steps of the branch-free loop are always
+the same, so the loop can be written out ahead of time. _make_search builds that code as a string for a given
+length, runs exec on it once, and caches the function. For n = 6 it makes:
+
+    def f(a, t):
+        i = 0
+        i = i + 3 if a[i + 3] <= t else i
+        i = i + 1 if a[i + 1] <= t else i
+        i = i + 1 if a[i + 1] <= t else i
+        return i if a[i] == t else -1
+
+The generated function has no loop and no half / n math, just ceil(log2(n)) compares. search itself still calls
+len(nums) and does an lru_cache lookup on every call to find the right function, so only the work inside the loop
+is gone. The cache has no size limit, so it keeps one generated function for every different length it has seen.
+'''
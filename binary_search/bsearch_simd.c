@@ -0,0 +1,74 @@
+/*
+Batched branch-free binary search, for when nums (X) is small and there are lots of targets (Y).
+
+Build with:
+    gcc -O3 -mavx2 -shared -fPIC binary_search/bsearch_simd.c -o binary_search/libbsearch_simd.so
+
+out[i] is the index of Y[i] in X, or -1 if it isn't there. X has to be sorted.
+
+Without -mavx2 (or -march=native on a CPU that has it) only the scalar loop gets built.
+*/
+
+#include <stdint.h>
+
+#ifdef __AVX2__
+#include <immintrin.h>
+#endif
+
+void bsearch_batch(const int64_t* X, int64_t n, const int64_t* Y, int64_t m, int64_t* out)
+{
+    int64_t i = 0;
+
+    if (n == 0) {
+        for (; i < m; i++)
+            out[i] = -1;
+        return;
+    }
+
+    /*
+    The step sizes only depend on n, so work them out once. 64 is plenty, n would need more than 2^64
+    elements to take more steps than that.
+    */
+    int64_t halves[64];
+    int steps = 0;
+    for (int64_t len = n; len > 1; len -= len >> 1)
+        halves[steps++] = len >> 1;
+
+#ifdef __AVX2__
+    /*
+    GCC won't vectorize the scalar loop below on its own (it can't work out how many times the inner loop
+    runs), so this does 4 targets per AVX2 register by hand:
+        gather X[base + half] for all 4 lanes
+        compare against the 4 targets
+        blend to pick base + half or base in each lane
+    */
+    for (; i + 4 <= m; i += 4) {
+        __m256i y = _mm256_loadu_si256((const __m256i*)(Y + i));
+        __m256i base = _mm256_setzero_si256();
+
+        for (int s = 0; s < steps; s++) {
+            __m256i next = _mm256_add_epi64(base, _mm256_set1_epi64x(halves[s]));
+            __m256i vals = _mm256_i64gather_epi64((const long long*)X, next, 8);
+            // Lanes where X[next] > y keep base, the rest move to next
+            __m256i too_big = _mm256_cmpgt_epi64(vals, y);
+            base = _mm256_blendv_epi8(next, base, too_big);
+        }
+
+        __m256i vals = _mm256_i64gather_epi64((const long long*)X, base, 8);
+        __m256i hit = _mm256_cmpeq_epi64(vals, y);
+        __m256i res = _mm256_blendv_epi8(_mm256_set1_epi64x(-1), base, hit);
+        _mm256_storeu_si256((__m256i*)(out + i), res);
+    }
+#endif
+
+    // Whatever is left over (or everything, without AVX2)
+    for (; i < m; i++) {
+        int64_t y = Y[i];
+        int64_t base = 0;
+
+        for (int s = 0; s < steps; s++)
+            base = (X[base + halves[s]] <= y) ? base + halves[s] : base;
+
+        out[i] = (X[base] == y) ? base : -1;
+    }
+}
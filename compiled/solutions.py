@@ -0,0 +1,106 @@
+'''
+Fully typed versions of the five solutions, written so mypyc can compile them ahead of time.
+
+The files in the pattern folders can't be compiled as they are (they redefine the same function several times,
+use List / ListNode without importing them, and some solutions need numpy, numba or exec), so this file has one
+plain Python version of each.
+
+Build from inside the compiled folder:
+    cd compiled
+    mypyc solutions.py
+
+mypyc puts the compiled extension (and a build folder) in the directory it's run from, so this puts it next to
+this file, and "from solutions import ..." picks it up instead of the .py. Running "mypyc compiled/solutions.py"
+from the repo root would put it in the root instead, and imports from in here would quietly get the plain .py.
+Unlike numba there's no compile step the first time a function runs, which matters when the process only ever
+runs each solution once.
+'''
+
+from __future__ import annotations
+
+from typing import Optional
+
+
+class ListNode:
+    def __init__(self, val: int = 0, next: Optional[ListNode] = None) -> None:
+        self.val = val
+        self.next = next
+
+
+# arrays_hashing/contains_duplicates.py
+def hasDuplicate(nums: list[int]) -> bool:
+    seen: set[int] = set()
+
+    for num in nums:
+        if num in seen:
+            return True
+        seen.add(num)
+
+    return False
+
+
+# binary_search/binary_search.py (branch-free solution)
+def search(nums: list[int], target: int) -> int:
+    if not nums:
+        return -1
+
+    base = 0
+    n = len(nums)
+
+    while n > 1:
+        half = n >> 1
+        base = base + half if nums[base + half] <= target else base
+        n -= half
+
+    return base if nums[base] == target else -1
+
+
+# linked_list/reverse_link_list.py (NeetCode solution)
+def reverseList(head: Optional[ListNode]) -> Optional[ListNode]:
+    prev: Optional[ListNode] = None
+    curr = head
+
+    while curr is not None:
+        nxt = curr.next
+        curr.next = prev
+        prev = curr
+        curr = nxt
+
+    return prev
+
+
+# sliding_window/best_time_to_buy_and_sell_stock.py (branchless loop)
+def maxProfit(prices: list[int]) -> int:
+    maxP = 0
+    minBuy = prices[0]
+
+    for sell in prices:
+        profit = sell - minBuy
+        maxP = maxP if maxP >= profit else profit
+        minBuy = minBuy if minBuy <= sell else sell
+
+    return maxP
+
+
+# two_pointers/valid_palindrome.py (hoisted lookups solution)
+def isPalindrome(s: str) -> bool:
+    s = s.lower()
+    back_ptr = len(s) - 1
+    front_ptr = 0
+
+    while front_ptr < back_ptr:
+        if not s[front_ptr].isalnum():
+            front_ptr += 1
+            continue
+
+        if not s[back_ptr].isalnum():
+            back_ptr -= 1
+            continue
+
+        if s[front_ptr] != s[back_ptr]:
+            return False
+
+        front_ptr += 1
+        back_ptr -= 1
+
+    return True
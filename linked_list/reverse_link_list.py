@@ -93,4 +93,60 @@ class Solution:
             curr.next = prev
             prev = curr
             curr = nxt
-        return prev
\ No newline at end of file
+        return prev
+
+# Cython Solution
+
+'''
+See reverse_link_list_cy.pyx. It's the NeetCode loop with ListNode as a cdef class, so curr.next is a C struct
+field instead of a Python attribute lookup.
+'''
+
+# Array Solution
+class Solution:
+    def reverseList(self, head: Optional[ListNode]) -> Optional[ListNode]:
+        if not head:
+            return head
+
+        nodes = []
+        curr = head
+        while curr:
+            nodes.append(curr)
+            curr = curr.next
+
+        for i in range(len(nodes) - 1, 0, -1):
+            nodes[i].next = nodes[i - 1]
+        nodes[0].next = None
+        return nodes[-1]
+
+'''
+First walk the list once and save every node in a Python list, then relink them using the saved references.
+The second loop never has to read .next to find the next node, it just indexes into the array.
+
+The downside is O(n) extra space for the array instead of O(1) like the NeetCode solution.
+'''
+
+# __slots__ Solution
+
+class ListNode:
+    __slots__ = ('val', 'next')
+
+    def __init__(self, val=0, next=None):
+        self.val = val
+        self.next = next
+
+class Solution:
+    def reverseList(self, head: Optional[ListNode]) -> Optional[ListNode]:
+        prev = None
+        curr = head
+        while curr:
+            curr.next, prev, curr = prev, curr, curr.next
+        return prev
+
+'''
+With __slots__, val and next are stored at fixed spots in the object instead of in a per node __dict__, so
+reading and writing .next skips the dict lookup (and each node uses less memory).
+
+The tuple assignment is the NeetCode loop in one line. The right side is evaluated first, so curr.next is read
+once before anything changes, and there's no nxt temp variable.
+'''
@@ -0,0 +1,38 @@
+# cython: language_level=3
+
+'''
+Cython version of the NeetCode solution in reverse_link_list.py.
+
+Build with:
+    cythonize -i linked_list/reverse_link_list_cy.pyx
+
+Then:
+    from reverse_link_list_cy import ListNode, reverse_list
+'''
+
+cdef class ListNode:
+    cdef public long val
+    cdef public ListNode next
+
+    def __init__(self, long val=0, ListNode next=None):
+        self.val = val
+        self.next = next
+
+
+cpdef ListNode reverse_list(ListNode head):
+    cdef ListNode prev = None
+    cdef ListNode curr = head
+    cdef ListNode nxt
+
+    while curr is not None:
+        nxt = curr.next
+        curr.next = prev
+        prev = curr
+        curr = nxt
+    return prev
+
+'''
+In the Python version every .next is an attribute lookup on the node object. Because ListNode is a cdef class
+here and prev / curr / nxt are typed as ListNode, Cython knows exactly where next is stored in the struct, so the
+loop reads and writes it directly in C without going through Python attribute lookup at all.
+'''
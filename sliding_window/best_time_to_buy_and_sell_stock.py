@@ -80,4 +80,130 @@ class Solution:
         for sell in prices:
             maxP = max(maxP, sell - minBuy)
             minBuy = min(minBuy, sell)
-        return maxP
\ No newline at end of file
+        return maxP
+
+# NumPy Solution
+def maxProfit(self, prices: List[int]) -> int:
+    # For short inputs the numpy call overhead costs more than the loop
+    if len(prices) < 64:
+        maxP = 0
+        minBuy = prices[0]
+
+        for sell in prices:
+            profit = sell - minBuy
+            maxP = maxP if maxP >= profit else profit
+            minBuy = minBuy if minBuy <= sell else sell
+        return maxP
+
+    import numpy as np
+
+    a = np.asarray(prices, dtype=np.int64)
+    return int((a - np.minimum.accumulate(a)).max(initial=0))
+
+'''
+np.minimum.accumulate(a)[i] is the lowest price up to and including day i, which is exactly minBuy in the
+NeetCode loop. Subtracting it from the prices gives the best profit for selling on each day, and the max of that
+is the answer. Both steps run in C over the whole array instead of one Python iteration per day.
+'''
+
+# Numba Solution
+from functools import lru_cache
+
+@lru_cache(maxsize=None)
+def _max_profit_nb():
+    from numba import njit, int64
+
+    @njit(int64(int64[::1]), cache=True, boundscheck=False, fastmath=True)
+    def _max_profit(p):
+        mn = p[0]
+        best = 0
+
+        for i in range(1, p.shape[0]):
+            v = p[i]
+            d = v - mn
+            best = best if best >= d else d
+            mn = mn if mn <= v else v
+        return best
+
+    return _max_profit
+
+@lru_cache(maxsize=None)
+def _max_profit_parallel_nb():
+    import numpy as np
+    from numba import njit, prange, int64
+
+    @njit(int64(int64[::1], int64), cache=True, parallel=True)
+    def _max_profit_parallel(p, chunks):
+        n = p.shape[0]
+        size = (n + chunks - 1) // chunks
+        chunks = (n + size - 1) // size  # so no chunk ends up empty
+        chunk_min = np.empty(chunks, dtype=np.int64)
+        chunk_max = np.empty(chunks, dtype=np.int64)
+        chunk_best = np.zeros(chunks, dtype=np.int64)
+
+        # Each chunk finds its own lowest price, highest price and best profit
+        for c in prange(chunks):
+            start = c * size
+            end = min(start + size, n)
+            mn = p[start]
+            mx = p[start]
+            best = 0
+            for i in range(start + 1, end):
+                v = p[i]
+                d = v - mn
+                best = best if best >= d else d
+                mn = mn if mn <= v else v
+                mx = mx if mx >= v else v
+            chunk_min[c] = mn
+            chunk_max[c] = mx
+            chunk_best[c] = best
+
+        # Then either the best trade is inside one chunk, or it buys at the lowest price
+        # in an earlier chunk and sells at the highest price in this one
+        best = chunk_best[0]
+        mn = chunk_min[0]
+        for c in range(1, chunks):
+            if chunk_best[c] > best:
+                best = chunk_best[c]
+            if chunk_max[c] - mn > best:
+                best = chunk_max[c] - mn
+            if chunk_min[c] < mn:
+                mn = chunk_min[c]
+        return best
+
+    return _max_profit_parallel
+
+def maxProfit(self, prices: List[int]) -> int:
+    import numpy as np
+
+    p = np.ascontiguousarray(prices, dtype=np.int64)
+
+    # The kernels skip bounds checks and read p[0] right away, so fail here like prices[0] does in the others
+    if p.shape[0] == 0:
+        raise IndexError('prices is empty')
+
+    # Only worth splitting across threads when there's a lot of prices
+    if p.shape[0] >= 1_000_000:
+        import numba
+        chunks = min(numba.get_num_threads() * 4, p.shape[0])
+        return int(_max_profit_parallel_nb()(p, chunks))
+
+    return int(_max_profit_nb()(p))
+
+'''
+The numpy solution goes over the prices twice and makes a whole extra array for the running minimum.
+Compiling the loop with numba keeps minBuy and maxP in registers and does it in one pass with no extra array.
+
+The "v < mn" check is only true when a new lowest price shows up, which is rare, so the CPU predicts it well
+(unlike binary search where it's a coin flip every time). The same goes for "d > best".
+
+The updates are still written as "best if best >= d else d" instead of if statements, because LLVM lowers that to
+a select (cmov / max / min) and the loop has no branches besides the loop itself. Since the old branches were
+already predicted well, the gain on random prices should be small.
+
+For really long inputs the parallel version splits the array into chunks, solves each chunk on its own thread, and
+then combines them in one short loop over the chunks.
+
+Each kernel has its own lru_cache'd builder that imports numba inside it, so neither one gets compiled until
+maxProfit needs it. Under 1,000,000 prices the parallel kernel is never built at all.
+'''
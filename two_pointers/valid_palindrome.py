@@ -95,11 +95,129 @@ class Solution:
         return newStr == newStr[::-1]
 
 
+# Translate Solution
 
-                
+_KEEP = bytes(c for c in range(128) if chr(c).isalnum())
+_DROP = bytes(c for c in range(256) if c not in _KEEP)
+_LOWER = bytes.maketrans(_KEEP, _KEEP.lower())
 
-                    
+class Solution:
+    def isPalindrome(self, s: str) -> bool:
+        cleaned = s.encode('ascii', 'ignore').translate(_LOWER, _DROP)
+        return cleaned == cleaned[::-1]
+
+'''
+The problem only counts A-Z, a-z and 0-9 as alphanumeric, so the string can be treated as ASCII bytes.
+bytes.translate lowercases and deletes everything that isn't alphanumeric in one pass in C, instead of calling
+isalpha / isnumeric / lower on every character from Python. The tables are built once when the file loads.
+'''
+
+# Numba Solution
+
+from functools import lru_cache
+
+@lru_cache(maxsize=None)
+def _is_palin_nb():
+    from numba import njit, boolean, types, uint8
+
+    # Read only, because np.frombuffer over a bytes object can't be written to
+    @njit(boolean(types.Array(uint8, 1, 'C', readonly=True)), cache=True)
+    def _is_palin(b):
+        lo = 0
+        hi = b.shape[0] - 1
+
+        while lo < hi:
+            # | 32 lowercases A-Z and leaves a-z and 0-9 alone
+            cl = b[lo] | 32
+            ch = b[hi] | 32
+
+            al = int(((b[lo] >= 48) & (b[lo] <= 57)) | ((cl >= 97) & (cl <= 122)))
+            ah = int(((b[hi] >= 48) & (b[hi] <= 57)) | ((ch >= 97) & (ch <= 122)))
+            both = al & ah
+
+            if both and cl != ch:
+                return False
+
+            lo += 1 - al + both
+            hi -= (al & (1 - ah)) + both
+
+        return True
+
+    return _is_palin
+
+class Solution:
+    def isPalindrome(self, s: str) -> bool:
+        import numpy as np
+
+        b = np.frombuffer(s.encode('ascii', 'ignore'), dtype=np.uint8)
+        return bool(_is_palin_nb()(b))
+
+'''
+Same two pointer idea as my fixed solution, but on the raw bytes and compiled with numba, so nothing gets copied
+into a cleaned up string first.
+
+Setting bit 32 turns A-Z into a-z and doesn't change digits or lowercase letters, so after "| 32" letters only
+need one range check. Digits are checked on the raw byte, since some control characters turn into digits with | 32.
+Instead of if/elif for which pointer to move, the pointers move by amounts worked out from al / ah:
+    front not alnum       -> lo += 1
+    back not alnum        -> hi -= 1
+    both alnum and equal  -> lo += 1, hi -= 1
+The only branch left is the mismatch check, which is almost never taken until the answer is False.
+
+Every other solution in this file is plain string code, so numba and numpy are only imported once this one
+actually runs. _is_palin_nb() builds the kernel on the first call and lru_cache hands back the same one after that.
+'''
+
+# Hoisted Lookups Solution
+
+_isalnum = str.isalnum
+
+class Solution:
+    def isPalindrome(self, s: str) -> bool:
+        s = s.lower()
+        back_ptr = len(s) - 1
+        front_ptr = 0
 
-                
+        while front_ptr < back_ptr:
+            front_letter = s[front_ptr]
+            back_letter = s[back_ptr]
 
+            if not _isalnum(front_letter):
+                front_ptr += 1
+                continue
 
+            if not _isalnum(back_letter):
+                back_ptr -= 1
+                continue
+
+            if front_letter != back_letter:
+                return False
+
+            front_ptr += 1
+            back_ptr -= 1
+
+        return True
+
+'''
+Same as my fixed solution with fewer method lookups per character:
+    - isalpha() or isnumeric() becomes one isalnum check
+    - str.isalnum is looked up once when the file loads, instead of on every character
+    - the whole string is lowercased once up front, so the loop doesn't call lower() at all
+'''
+
+# Regex Solution
+
+import re
+
+_NOT_ALNUM = re.compile(r'[^a-z0-9]')
+
+class Solution:
+    def isPalindrome(self, s: str) -> bool:
+        cleaned = _NOT_ALNUM.sub('', s.lower())
+        return cleaned == cleaned[::-1]
+
+'''
+The NeetCode solution builds newStr with +=, and since strings can't be changed in place that can copy the string
+every time, which is O(n^2) in the worst case. Here the regex (compiled once when the file loads) removes every
+character that isn't a-z or 0-9 in a single pass in C. Comparing to the reversed string is also done in C.
+'''